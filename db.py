@@ -10,6 +10,12 @@
 # @section libraries_db Модули
 #   - sqlite3
 #       - Модуль для работы с базой данных SQLite3  
+#   - queue
+#       - Очередь соединений пула на чтение
+#   - threading
+#       - Блокировки соединения на запись и пула
+#   - contextlib
+#       - Выдача соединений через контекстный менеджер
 # @section notes_db Заметки
 #
 # @section list_of_changes_db Список изменений
@@ -25,6 +31,17 @@
 #   - Добавлены методы Нестеренко А.И. 20/04/2022:
 #       - SQL.execute_requests
 #       - SQL.return_info
+#   - Добавлены методы agent 15/10/2026:
+#       - SQL.__enter__
+#       - SQL.__exit__
+#       - SQL._connect
+#       - SQL._writer
+#       - SQL._checkout
+#       - SQL.close
+#       - SQL.create_index_request
+#       - SQL.bulk_insert
+#   - Удалены методы agent 15/10/2026:
+#       - SQL.__create_table (перенесен в SQL.create_db)
 #
 # @section author_db Авторы
 # - Савинов В.В.
@@ -32,13 +49,21 @@
 #
 # Copyright (c) 2022 ИРИБ.  All rights reserved.
 
-from asyncio.windows_events import NULL
-from xmlrpc.client import Boolean
-
-from requests import request
-
 import system
 import sqlite3
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+## Поля таблицы pair в порядке, в котором их возвращает table_parser
+COLUMNS = ['day', 'lesson_number', 'week_number', 'group_name', 'teacher_name',
+ 'lesson', 'lesson_type', 'auditorium']
+## Настройки, применяемые к каждому открытому соединению
+PRAGMAS = ['journal_mode=WAL', 'synchronous=NORMAL', 'temp_store=MEMORY',
+ 'cache_size=-65536', 'mmap_size=268435456']
+## Максимальное количество соединений на чтение в пуле
+POOL_SIZE = 8
 
 
 class SQL:
@@ -47,9 +72,10 @@ class SQL:
     Класс работы с базой данныйх
     """
 
-    def __init__(self, path, day=NULL, lesson_number=NULL, week_number=NULL,
-     group_name=NULL, teacher_name=NULL, lesson=NULL, lesson_type=NULL,
-      auditorium=NULL):
+    def __init__(self, path: str, day: Optional[str] = None, lesson_number: Optional[int] = None,
+     week_number: Optional[str] = None, group_name: Optional[str] = None,
+      teacher_name: Optional[str] = None, lesson: Optional[str] = None,
+       lesson_type: Optional[str] = None, auditorium: Optional[str] = None) -> None:
         """! Constructor
         
         Конструктор класса
@@ -74,8 +100,100 @@ class SQL:
         self.teacher_name = teacher_name
         ## Путь к файлу базы данных
         self.path = path
+        ## Соединение на запись (SQLite допускает только одного писателя)
+        self._conn: Optional[sqlite3.Connection] = None
+        ## Блокировка соединения на запись
+        self._write_lock = threading.Lock()
+        ## Пул соединений на чтение
+        self._pool: queue.Queue = queue.Queue(maxsize=POOL_SIZE)
+        ## Количество открытых соединений в пуле
+        self._pool_size = 0
+        ## Блокировка пула при открытии новых соединений
+        self._pool_lock = threading.Lock()
+
+    def __enter__(self) -> 'SQL':
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """! Open database connection
+
+        Открывает новое соединение с базой данных и применяет к нему
+        настройки из PRAGMAS. Транзакции управляются вручную
+
+        @return Соединение с базой данных
+        """
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        for pragma in PRAGMAS:
+            conn.execute(f'PRAGMA {pragma};')
+        return conn
+
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        """! Get write connection
+
+        Выдает единственное соединение на запись, открывая его при первом обращении
+
+        @return Соединение с базой данных
+        """
+        with self._write_lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            yield self._conn
 
-    def create_table_request(name: str, **kwargs: dict) -> str:
+    @contextmanager
+    def _checkout(self) -> Iterator[sqlite3.Connection]:
+        """! Get read connection from pool
+
+        Выдает соединение на чтение из пула и возвращает его обратно после
+        использования. Новые соединения открываются, пока пул не заполнен
+
+        @return Соединение с базой данных
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                opened = self._pool_size < POOL_SIZE
+                if opened:
+                    self._pool_size += 1
+            if not opened:
+                conn = self._pool.get()
+            else:
+                try:
+                    conn = self._connect()
+                except BaseException:
+                    with self._pool_lock:
+                        self._pool_size -= 1
+                    raise
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close(self) -> None:
+        """! Close database connections
+
+        Закрывает все соединения с базой данных. Соединения на чтение,
+        которые в этот момент используются, будут закрыты при следующем вызове
+        """
+        with self._write_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        with self._pool_lock:
+            while True:
+                try:
+                    conn = self._pool.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                self._pool_size -= 1
+
+    @staticmethod
+    def create_table_request(name: str, **kwargs: str) -> str:
         """! Create table request
 
         Создание SQL запроса на создание таблицы
@@ -85,29 +203,35 @@ class SQL:
 
         @return SQL запрос для создания таблицы в БД
         """
-        request = f'CREATE TABLE IF NOT EXISTS {name}(\nID INTEGER PRIMARY KEY AUTOINCREMENT'
-        for param, type in kwargs.items():
-            request = request + f',\n{str(param)} {type}'
-        request = request + ');'
-        return request
+        columns = ['ID INTEGER PRIMARY KEY AUTOINCREMENT']
+        columns.extend(f'{param} {type}' for param, type in kwargs.items())
+        return f'CREATE TABLE IF NOT EXISTS {name}(\n' + ',\n'.join(columns) + ');'
+
+    @staticmethod
+    def create_index_request(name: str, table: str, *columns: str) -> str:
+        """! Create index request
 
-    def insert_datas_to_db(self, name: str, **kwargs: dict) -> str:
+        Создание SQL запроса на создание индекса
+
+        @params name Название индекса
+        @params table Название таблицы
+        @params *columns Названия индексируемых полей
+
+        @return SQL запрос для создания индекса в БД
+        """
+        return f'CREATE INDEX IF NOT EXISTS {name} ON {table}({", ".join(columns)});'
+
+    def insert_datas_to_db(self, name: str, columns: list) -> str:
         """! Insert datas to database
         
-        Добавить запись в таблицу
+        Создание параметризованного SQL запроса на добавление записей в таблицу
 
         @params name Название таблицы
-        @params **kwargs Словарь типа {Название поля} : {Значение}
-        @return SQL запрос для добавления записей в БД
+        @params columns Список названий полей
+        @return SQL запрос для добавления записей в БД (значения передаются отдельно)
         """
-        request = f'INSERT INTO {name} ('
-        temp = ''
-        for param, value in kwargs.items():
-            request = request + f'{str(param)}, '
-            temp = temp + f"'{value}', "
-        request = request[:-2] + ')\nVALUES (' + temp
-        request = request[:-2] + ');'
-        return request
+        placeholders = ', '.join('?' * len(columns))
+        return f'INSERT INTO {name} ({", ".join(columns)})\nVALUES ({placeholders});'
 
     def return_all_from_db(self, name: str) -> str:
         """! Return all values from table
@@ -120,6 +244,7 @@ class SQL:
         """
         return f'SELECT * FROM {name};'
 
+    @staticmethod
     def __craete_db_file() -> str:
         """! Create database file
         
@@ -129,74 +254,84 @@ class SQL:
         """
         return system.create_file('Database','test','sqlite3')
 
-    def __create_table(db_file: str):
-        """! Create table in database
-
-        Создает таблицу для хранения данных о прах
-
-        @param db_file Путь к файлу
-        """
-        conn = sqlite3.connect(db_file)
-        cur = conn.cursor()
-        cur.execute(SQL.create_table_request('pair', day='VARCHAR(16)', lesson_number='INT',
-         week_number='VARCHAR(32)', group_name='VARCHAR(16)', teacher_name='VARCHAR(64)',
-          lesson='VARCHAR(128)', lesson_type='VARCHAR(4)', auditorium='VARCHAR(8)'))
-        conn.commit()
-
-
-    def execute_requests(self, request: str):
+    def execute_requests(self, request: str, params: tuple = ()) -> None:
         """! Execute INSERT method
 
         Сохраняет данные в таблицу по указанному SQL запросу
 
-        @param request INSERT запрос
+        @param request INSERT запрос с плейсхолдерами "?"
+        @param params Значения для плейсхолдеров
         """
-        conn = sqlite3.connect(self.path)
-        cur = conn.cursor()
-        cur.execute(request)
-        conn.commit()
+        with self._writer() as conn:
+            conn.execute(request, params)
 
-    def return_info(self, request: str) -> list:
+    def return_info(self, request: str, params: tuple = ()) -> list:
         """! Execute SELECT method
 
         Возвращает инфу с таблицы по указанному запросу
 
-        @param request SELECT запрос
+        @param request SELECT запрос с плейсхолдерами "?"
+        @param params Значения для плейсхолдеров
 
         @return Список со всеми подходящими под запрос записями
         """
-        conn = sqlite3.connect(self.path)
-        cur = conn.cursor()
-        cur.execute(request)
-        return cur.fetchall()
+        with self._checkout() as conn:
+            return conn.execute(request, params).fetchall()
+
+    def bulk_insert(self, name: str, columns: list, rows: list) -> None:
+        """! Execute INSERT method for many rows
+
+        Сохраняет все записи в таблицу одной транзакцией
+
+        @param name Название таблицы
+        @param columns Список названий полей
+        @param rows Список кортежей со значениями полей
+        """
+        with self._writer() as conn:
+            conn.execute('BEGIN')
+            try:
+                conn.executemany(self.insert_datas_to_db(name, columns), rows)
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
 
     @staticmethod
     def create_db() -> str:
         """! Create whole database with all needed tables
         
-        Создает базу данных со всеми нужными таблицами
+        Создает базу данных со всеми нужными таблицами и индексами
+        одной транзакцией
 
         @return Возвращает путь к файлу
         """
         path = SQL.__craete_db_file()
-        SQL.__create_table(path)
+        script = '\n'.join([
+            'BEGIN;',
+            SQL.create_table_request('pair', day='VARCHAR(16)', lesson_number='INT',
+             week_number='VARCHAR(32)', group_name='VARCHAR(16)', teacher_name='VARCHAR(64)',
+              lesson='VARCHAR(128)', lesson_type='VARCHAR(4)', auditorium='VARCHAR(8)'),
+            SQL.create_index_request('idx_pair_group', 'pair', 'group_name', 'week_number', 'day'),
+            SQL.create_index_request('idx_pair_teacher', 'pair', 'teacher_name', 'week_number', 'day'),
+            'COMMIT;',
+        ])
+        with SQL(path) as db, db._writer() as conn:
+            conn.executescript(script)
         return path
 
 
 
 
 
-def main():
+def main() -> None:
     """! Function to test and debug code
 
     Эта функция используется для отладки написанного кода
     """
-    test = SQL()
-    test.create_db()
-    a = test.insert_datas_to_db('pair', day='1', lesson_number=2, week_number='3', group_name='4', teacher_name='5', lesson='6', lesson_type='7', auditorium='8')
-    test.execute_requests(a)
-    a = test.return_all_from_db('pair')
-    print(test.return_info(a))
+    with SQL(SQL.create_db()) as test:
+        test.bulk_insert('pair', COLUMNS, [('1', 2, '3', '4', '5', '6', '7', '8')])
+        a = test.return_all_from_db('pair')
+        print(test.return_info(a))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
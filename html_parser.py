@@ -10,8 +10,12 @@
 # @section libraries_html_parser Модули
 # - requests
 #   - Получение содержимого с html документа.
-# - bs4
-#   - Парсинг html документа
+# - requests_cache
+#   - Кэширование ответов сервера между запусками
+# - concurrent.futures
+#   - Параллельная загрузка файлов расписания
+# - lxml
+#   - Потоковый парсинг html документа
 #
 # @section notes_html_parser Заметки
 # - @maybe_next_time используется для обозначения методов,
@@ -22,6 +26,18 @@
 #   - Добавлена doxygen документация Нестеренко А.И. 14/04/2022
 #   - Добавлены методы Нестеренко А.И. 14/04/2022:
 #       - check_response
+#   - Добавлены методы agent 15/10/2026:
+#       - has_class
+#       - iter_institutes
+#       - is_schedule_file
+#       - is_semester_title
+#       - parse_institute
+#       - save_schedule_file
+#   - Удалены методы agent 15/10/2026:
+#       - get_semester_index
+#       - get_files_url (ссылки собирает parse_institute)
+#       - get_schedule_from_first_semester (заменен parse_institute)
+#       - get_schedule_from_second_semester (заменен parse_institute)
 #
 # @section author_html_parser Авторы
 # - Савинов В.В.
@@ -30,125 +46,180 @@
 # Copyright (c) 2022 ИРИБ.  All rights reserved.
 
 
-from xmlrpc.client import Boolean
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag, ResultSet
+from requests.adapters import HTTPAdapter
+import requests_cache
+from lxml import etree
+import re
+from typing import Iterator, Optional
 import system
 import utils
 
 BASE_URL = 'https://www.sevsu.ru'
 URL = 'https://www.sevsu.ru/univers/shedule'
 HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:99.0) Gecko/20100101 Firefox/99.0'}
-
-
-def get_base_block(url: str, headers: dict) -> ResultSet:
+## Сессия с кэшированием ответов сервера (хранится 6 часов)
+SESSION = requests_cache.CachedSession('sevsu_cache', backend='sqlite', expire_after=21600,
+                                       allowable_codes=[200])
+## Количество одновременных загрузок файлов
+MAX_WORKERS = 16
+## Размер блока, которыми страница передается парсеру
+CHUNK_SIZE = 8192
+## Шаблон заголовка семестра
+SEMESTER_RE = re.compile('семестр', re.IGNORECASE)
+## Расширения файлов расписания
+SCHEDULE_EXTENSIONS = ('xls', 'xlsx')
+## Сессия без кэширования для загрузки файлов расписания
+DOWNLOAD_SESSION = requests.Session()
+DOWNLOAD_SESSION.mount('https://', HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS))
+
+
+def get_base_block(url: str, headers: dict) -> Optional[Iterator[etree._Element]]:
     """! Get base div with all institutes
 
     Этот метод используется для получения базового блока div с расписанями
     (Берет только первый блок для студентов ОФО).
 
+    Страница запрашивается через кэширующую сессию SESSION, которая
+    целиком считывает тело ответа для сохранения в кэш (или отдает его
+    из кэша), поэтому потоковый разбор экономит память только на построении
+    дерева, но не на загрузке страницы.
+
     @maybe_next_time Получение расписания не только для ОФО,
     но и для ЗФО
 
     @param url  Ссылка на страницу расписания СевГУ
     @param headers  Настройки браузера
 
-    @return Все блоки институтов с классом "su-spoiler"
+    @return Генератор блоков институтов с классом "su-spoiler"
     """
-    html = requests.get(url=url, headers=headers)
+    html = SESSION.get(url, headers=headers, stream=True)
     if not check_response(html.status_code):
+        html.close()
         return None
-    soup = BeautifulSoup(html.text, "lxml")
-    return soup.find("div", class_="su-column-content").find_all("div", class_="su-spoiler")
+    return iter_institutes(html)
+
+
+def has_class(element: etree._Element, name: str) -> bool:
+    """! Check element class
+
+    Этот метод используется для проверки наличия класса у тега
+
+    @param element Тег html документа
+    @param name Название класса
+
+    @return Возвращает True если у тега есть указанный класс
+    """
+    return name in (element.get('class') or '').split()
 
 
-def get_institute_name(soup: Tag) -> str:
+def iter_institutes(html: requests.Response) -> Iterator[etree._Element]:
+    """! Stream institute blocks from html
+
+    Этот метод используется для потокового разбора страницы: блоки
+    институтов отдаются по мере загрузки, после обработки блок очищается,
+    а разбор прекращается после окончания первого блока "su-column-content".
+    По завершении разбора парсер и ответ сервера закрываются
+
+    @param html Ответ сервера, полученный с stream=True
+
+    @return Генератор блоков институтов с классом "su-spoiler"
+    """
+    parser = etree.HTMLPullParser(events=('start', 'end'), encoding=html.encoding)
+    inside = False
+    try:
+        for chunk in html.iter_content(CHUNK_SIZE):
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if element.tag != 'div':
+                    continue
+                if has_class(element, 'su-column-content'):
+                    if event == 'end':
+                        return
+                    inside = True
+                elif inside and event == 'end' and has_class(element, 'su-spoiler'):
+                    yield element
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+    finally:
+        parser.close()
+        html.close()
+
+
+def get_institute_name(soup: etree._Element) -> str:
     """! Get institution name
     
     Этот метод используется для получения названия института
 
-    @param soup Объект Tag, полученный путем разбиения базового блока на
+    @param soup Объект Element, полученный путем разбиения базового блока на
     блоки отдельных институтов.
 
     @return Название института
     """
-    return soup.find('h3').text
+    return ''.join(next(soup.iter('h3')).itertext())
 
 
-def get_files_url(soup: Tag) -> list:
-    """! Get links to files with xls & xlsx extension
+def is_schedule_file(link: str) -> bool:
+    """! Check if link leads to schedule file
 
-    Этот метод берет используется для получения ссылок на все
-    расписания в блоке института.
-    
-    @param soup Объект Tag, полученный путем разбиения базового блока на
-    блоки отдельных институтов
+    Этот метод используется для проверки, что ссылка ведет на файл
+    с расширением xls или xlsx
 
-    @return Список ссылок на файлы (без корневого адресса)
+    @param link Ссылка на файл
+
+    @return Возвращает True если ссылка ведет на файл расписания
     """
-    links = soup.find("div", class_="su-clearfix").find_all("a")
-    links = [link.get("href") for link in links]
-    links = [link for link in links if utils.get_extension(link) == 'xls' or utils.get_extension(link) == 'xlsx']
-    return links
+    return utils.get_extension(link) in SCHEDULE_EXTENSIONS
 
 
-def get_semester_index(soup: Tag) -> list:
-    """! Get index of 1 & 2 semester
-    
-    Этот метод используется для получения индексов параграфов с
-    названиями семетров
+def is_semester_title(paragraph: etree._Element) -> bool:
+    """! Check if paragraph is semester title
 
-    @param soup Объект Tag, полученный путем разбиения базового блока на
-    блоки отдельных институтов
+    Этот метод используется для проверки, что параграф является
+    заголовком семестра
 
-    @return список индексов:\n
-        Если 2 элемента в списке, то [0] - первый семестр [1] - второй семестр\n
-        Если 1 элемент в списке, то [0] - второй семестр\n
-        Если 0 элементов в списке, то расписаний для этого института нет
-    """
-    indexes = [paragraph.text.replace('\xa0', ' ').lower() for paragraph in soup.find_all('p')]
-    indexes = [index for index in range(len(indexes)) if 'семестр' in indexes[index]]
-    return indexes
+    @param paragraph Объект Element параграфа
 
+    @return Возвращает True если в тексте параграфа есть слово "семестр"
+    """
+    return SEMESTER_RE.search(''.join(paragraph.itertext())) is not None
 
-def get_schedule_from_first_semester(soup: Tag) -> list:
-    """! Get shedule for 1 semester 
-    
-    Этот метод используется для получения расписания института на 1 семестр
-    
-    @param soup Объект Tag, полученный путем разбиения базового блока на
-    блоки отдельных институтов
 
-    @return Список ссылок расписания института на 1 семестр, если таковых нет
-    будет возвращен пустой список
-    """
-    indexes = get_semester_index(soup)
-    if len(indexes) == 2:
-        return get_files_url(soup)[:indexes[-1] - indexes[0] - 1]
-    return []
+def parse_institute(soup: etree._Element) -> tuple[str, list, list]:
+    """! Get institute name and shedule for both semesters
 
+    Этот метод используется для получения названия института и ссылок на
+    расписания обоих семестров за один проход по блоку "su-clearfix" института.
+    Ссылки делятся на семестры по количеству ссылок, встреченных до
+    заголовков семестров: ссылки до первого заголовка не относятся ни к
+    одному семестру, а при единственном заголовке все ссылки после него
+    относятся ко 2 семестру
 
-def get_schedule_from_second_semester(soup: Tag) -> list:
-    """! Get shedule for 2 semester 
-    
-    Этот метод используется для получения расписания института на 2 семестр
-    
-    @param soup Объект Tag, полученный путем разбиения базового блока на
+    @param soup Объект Element, полученный путем разбиения базового блока на
     блоки отдельных институтов
 
-    @return Список ссылок расписания института на 2 семестр, если таковых нет
-    будет возвращен пустой список
+    @return Кортеж (название института, ссылки на 1 семестр, ссылки на 2 семестр),
+    если расписаний на семестр нет, вместо ссылок будет пустой список
     """
-    indexes = get_semester_index(soup)
-    if len(indexes) == 2:
-        return get_files_url(soup)[indexes[-1] - 1:]
-    elif len(indexes) == 1:
-        return get_files_url(soup)[indexes[0] + 1:]
-    return []
-
-
-def check_response(response: int) -> Boolean:
+    links: list[str] = []
+    splits: list[int] = []
+    block = next(div for div in soup.iter('div') if has_class(div, 'su-clearfix'))
+    for node in block.iter('a', 'p'):
+        if node.tag == 'a':
+            link = node.get('href')
+            if link and is_schedule_file(link):
+                links.append(link)
+        elif node.tag == 'p' and is_semester_title(node):
+            splits.append(len(links))
+    # один заголовок означает, что расписание есть только на 2 семестр
+    start = splits[0] if splits else len(links)
+    split = splits[-1] if splits else len(links)
+    return get_institute_name(soup), links[start:split], links[split:]
+
+
+def check_response(response: int) -> bool:
     """! Check if SevSU server is responsing
 
     Этот метод используется для проверки работоспособности сайта
@@ -157,29 +228,40 @@ def check_response(response: int) -> Boolean:
 
     @return Возвращает True если ошибок с ответом от сервера нет
     """
-    return True if response == 200 else False
+    return response == 200
+
+
+def save_schedule_file(download: tuple[str, str, str, str]) -> None:
+    """! Save shedule file through shared session
+
+    Этот метод используется для загрузки файла расписания в потоке
+    через общую сессию DOWNLOAD_SESSION (файлы не кэшируются)
+
+    @param download Кортеж (название директории, название файла, ссылка на файл,
+    расширение файла)
+    """
+    system.save_file(*download, session=DOWNLOAD_SESSION)
 
 
-def main():
+def main() -> None:
     """! Function to test and debug code
 
     Эта функция используется для отладки написанного кода
     """
     base = get_base_block(URL, HEADERS)
-    if base == None:
+    if base is None:
         return None
     system.make_directory('General')
+    downloads: list[tuple[str, str, str, str]] = []
+    semester = utils.get_current_semester()
     for tag in base:
-        if utils.get_current_semester() == 1:
-            name = get_institute_name(tag)
-            a = [BASE_URL + link for link in get_schedule_from_first_semester(tag)]
-        else:
-            name = get_institute_name(tag)
-            a = [BASE_URL + link for link in get_schedule_from_second_semester(tag)]
-        if a:
-            for index, item in enumerate(a):
-                path = utils.transliteration_to_en_from_ru(name)
-                system.save_file(path, str(index), item, utils.get_extension(item))
+        name, *schedules = parse_institute(tag)
+        path = utils.transliteration_to_en_from_ru(name)
+        # повторяющиеся ссылки семестра загружаются один раз
+        for index, link in enumerate(dict.fromkeys(schedules[semester - 1])):
+            downloads.append((path, str(index), BASE_URL + link, utils.get_extension(link)))
+    with ThreadPoolExecutor(MAX_WORKERS) as executor:
+        list(executor.map(save_schedule_file, downloads))
 
 
 if __name__ == '__main__':
@@ -21,8 +21,7 @@
 # Copyright (c) 2022 ИРИБ.  All rights reserved.
 import pandas as pd
 
-from html_parser import get_base_block, get_institute_name, get_files_url, get_schedule_from_first_semester, \
-    get_schedule_from_second_semester
+from html_parser import get_base_block, parse_institute
 from table_parser import get_sheet_names_from_table
 from utils import get_extension, get_current_semester
 from utils import transliteration_to_en_from_ru
@@ -39,14 +38,12 @@ def main():
     Эта функция используется для отладки написанного кода
     """
     base = get_base_block(URL, HEADERS)
+    semester = get_current_semester()
 
     for item in base:
-        name = transliteration_to_en_from_ru(get_institute_name(item))
-        links = get_files_url(item)
-        if get_current_semester() == 1:
-            links = [BASE_URL + link for link in get_schedule_from_first_semester(item)]
-        else:
-            links = [BASE_URL + link for link in get_schedule_from_second_semester(item)]
+        name, *schedules = parse_institute(item)
+        name = transliteration_to_en_from_ru(name)
+        links = [BASE_URL + link for link in dict.fromkeys(schedules[semester - 1])]
         if links:
             for idx, link in enumerate(links):
                 print(link)
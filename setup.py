@@ -0,0 +1,30 @@
+"""! @brief Сборка модулей парсера в C расширения"""
+##
+# @file setup.py
+#
+# @brief Компиляция модулей с помощью mypyc.
+#
+# @section description_setup Описание
+# Собирает типизированные модули в .so расширения, которые импортируются
+# так же, как исходные py файлы:\n
+#   python setup.py build_ext --inplace
+#
+# @section libraries_setup Модули
+# - mypyc
+#   - Компиляция аннотированного python кода в C расширения
+#
+# @section list_of_changes_setup Список изменений
+#   - Файл создан agent 15/10/2026
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='sevsu_sheets_parser',
+    ext_modules=mypycify([
+        '--ignore-missing-imports',
+        '--follow-imports=silent',
+        'db.py',
+        'html_parser.py',
+        'utils.py',
+    ]),
+)
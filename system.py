@@ -30,12 +30,16 @@
 # Copyright (c) 2022 ИРИБ.  All rights reserved.
 
 
-from distutils import extension
 import os
-from numpy import full
 import requests
+from typing import Optional
 from config import *
 
+## Размер блока при записи загружаемого файла на диск
+CHUNK_SIZE = 1 << 16
+## Время ожидания ответа сервера при загрузке файла (в секундах)
+TIMEOUT = 30
+
 
 def make_directory(filename: str):
     """! mkdir
@@ -45,26 +49,29 @@ def make_directory(filename: str):
 
     @param filename Название директории  
     """
-    if os.path.exists(filename):
-        return
-    os.mkdir(filename)
+    os.makedirs(filename, exist_ok=True)
 
 
-def save_file(path: str, name: str, url: str, extension: str) -> None:
+def save_file(path: str, name: str, url: str, extension: str,
+              session: Optional[requests.Session] = None) -> None:
     """! Save shedule file
     
-    Этот метод используется для сохранения расписания в директорию института
+    Этот метод используется для сохранения расписания в директорию института.
+    Файл записывается на диск блоками по мере загрузки
 
     @param path Название директории внутри папки General
     @param name Название файла
     @param url  Ссылка на файл
     @param extension    Расширение файла 
+    @param session  Сессия для переиспользования соединений (по умолчанию
+    открывается новое соединение). Сессия не должна кэшировать ответы:
+    кэширующая сессия целиком считывает файл в память для сохранения в кэш
     """
     make_directory(f'General/{path}')
-    f = open(f'General/{path}/{name}.{extension}', "wb")
-    file = requests.get(url)
-    f.write(file.content)
-    f.close()
+    with (session or requests).get(url, stream=True, timeout=TIMEOUT) as file, \
+            open(f'General/{path}/{name}.{extension}', "wb") as f:
+        for chunk in file.iter_content(CHUNK_SIZE):
+            f.write(chunk)
 
 
 def get_path_schedule_files() -> list:
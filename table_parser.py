@@ -42,7 +42,6 @@
 # - Нестеренко А.И.
 #
 # Copyright (c) 2022 ИРИБ.  All rights reserved.
-from calendar import week
 import re
 from datetime import datetime, timedelta, time
 import pandas as pd
@@ -477,23 +476,12 @@ def main():
         # df.to_excel('test3.xlsx', sheet_name='test', header=True, index=False)
         indexes = test_get_useful_columns(df)
         # print(indexes)
-        path = db.SQL.create_db()
-        for i in df.index[2:]:
-            for j in indexes:
-                a = get_information_for_database_from_table(df, i, j)
-                test = db.SQL(path, a[0], a[1], a[2], a[3], a[4], a[5], a[6], a[7])
-                request = test.insert_datas_to_db('pair',
-                day=test.day,
-                lesson_number=test.lesson_number,
-                week_number=test.week_number,
-                group_name=test.group_name,
-                teacher_name=test.teacher_name,
-                lesson=test.lesson,
-                lesson_type=test.lesson_type,
-                auditorium=test.auditorium)
-                test.execute_requests(request)
-        test = test.return_info("SELECT * FROM pair WHERE group_name = 'ПСДс-21-2' AND week_number = '2022-04-25'")
-        for item in test:
+        rows = [get_information_for_database_from_table(df, i, j) for i in df.index[2:] for j in indexes]
+        with db.SQL(db.SQL.create_db()) as test:
+            test.bulk_insert('pair', db.COLUMNS, rows)
+            info = test.return_info('SELECT * FROM pair WHERE group_name = ? AND week_number = ?',
+                                    ('ПСДс-21-2', '2022-04-25'))
+        for item in info:
             print(item)
 #
 
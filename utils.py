@@ -64,12 +64,10 @@ def get_extension(filename: str) -> str:
     
     @param filename Ссылка на файл
 
-    @return Расширение файла без точки
+    @return Расширение файла без точки (пустая строка, если расширения нет)
     """
-    index = filename.rfind('.')
-    if index < 0:
-        return None
-    return filename[index + 1:]
+    _, dot, extension = filename.rpartition('.')
+    return extension if dot else ''
 
 
 def update_format_date(date: str) -> str:
@@ -89,7 +87,7 @@ def update_format_date(date: str) -> str:
     return date
 
 
-def main():
+def main() -> None:
     """! Function to test and debug code
 
     Эта функция используется для отладки написанного кода